@@ -2,6 +2,8 @@
 """Test Call class
 """
 
+import pytest
+
 import vcfpy
 from vcfpy import record
 
@@ -45,6 +47,18 @@ def test_is_phased_false():
     assert call.is_phased is False
 
 
+def test_is_phased_no_gt():
+    call = record.Call("sample", vcfpy.OrderedDict([("GT", None)]))
+    assert call.is_phased is False
+
+
+def test_is_phased_set_genotype():
+    call = record.Call("sample", vcfpy.OrderedDict([("GT", "0/1")]))
+    call.set_genotype("1|0")
+    assert call.is_phased is True
+    assert call.gt_phase_char == "|"
+
+
 # Call.gt_phase_char() --------------------------------------------------------
 
 
@@ -85,6 +99,12 @@ def test_gt_bases_0_2():
     assert call.gt_bases == ("C", "A")
 
 
+def test_gt_bases_no_call():
+    call = record.Call("sample", vcfpy.OrderedDict([("GT", "./1")]))
+    build_rec([call])
+    assert call.gt_bases == (None, "T")
+
+
 # Call.gt_type() --------------------------------------------------------------
 
 
@@ -103,6 +123,38 @@ def test_gt_type_hom_alt():
     assert call.gt_type == vcfpy.HOM_ALT
 
 
+@pytest.mark.parametrize(
+    "gt,expected",
+    [
+        ("1/2", vcfpy.HET),
+        ("0/0/1", vcfpy.HET),
+        ("0", vcfpy.HOM_REF),
+        ("2", vcfpy.HOM_ALT),
+        ("1|1|1", vcfpy.HOM_ALT),
+        ("0/.", None),
+    ],
+)
+def test_gt_type_ploidy(gt, expected):
+    call = record.Call("sample", vcfpy.OrderedDict([("GT", gt)]))
+    assert call.gt_type == expected
+
+
+# Record.gt_types(), Record.sparse_gt_types() ---------------------------------
+
+
+def test_record_gt_types_and_sparse_gt_types():
+    calls = [
+        record.Call("s{}".format(i), vcfpy.OrderedDict([("GT", gt)]))
+        for i, gt in enumerate(["0/0", "0|1", "2/2", "./.", "0/."])
+    ]
+    calls.append(record.UnparsedCall("s5", "0/1"))
+    rec = build_rec(calls)
+    assert list(rec.gt_types()) == [vcfpy.HOM_REF, vcfpy.HET, vcfpy.HOM_ALT, -1, -1, -1]
+    indices, values = rec.sparse_gt_types()
+    assert list(indices) == [1, 2, 3, 4, 5]
+    assert list(values) == [vcfpy.HET, vcfpy.HOM_ALT, -1, -1, -1]
+
+
 # Call.is_het() ---------------------------------------------------------------
 
 
@@ -164,6 +216,36 @@ def test_ploidy_two():
     assert call.ploidy == 2
 
 
+# Call.gt_alleles / Call.called -----------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "gt,gt_alleles,called",
+    [
+        ("0/1", [0, 1], True),
+        ("1|2", [1, 2], True),
+        ("0/1|2", [0, 1, 2], True),
+        ("./1", [None, 1], False),
+        (".", [None], False),
+        (None, None, None),
+    ],
+)
+def test_gt_alleles(gt, gt_alleles, called):
+    call = record.Call("sample", vcfpy.OrderedDict([("GT", gt)]))
+    assert call.gt_alleles == gt_alleles
+    assert call.called is called
+
+
+def test_gt_alleles_parsed_on_first_access():
+    call = record.Call("sample", vcfpy.OrderedDict([("GT", "invalid")]))
+    call.data["GT"] = "0|1"
+    assert call.gt_alleles == [0, 1]
+    assert call.is_phased
+    call.gt_alleles = [1, 1]
+    assert call.gt_alleles == [1, 1]
+    assert call.ploidy == 2
+
+
 # Call.is_filtered() ----------------------------------------------------------
 
 
@@ -180,3 +262,19 @@ def test_gt_type_filtered_empty():
 def test_gt_type_filtered_pass():
     call = record.Call("sample", vcfpy.OrderedDict([("GT", "1/1"), ("FT", ["PASS"])]))
     assert not call.is_filtered()
+
+
+@pytest.mark.parametrize(
+    "fts,require,ignore,expected",
+    [
+        (["q10"], None, None, True),
+        (["PASS", "q10"], None, None, True),
+        (["q10"], None, ["q10"], False),
+        (["q10"], ["s50"], None, False),
+        (["q10", "s50"], ["s50"], None, True),
+        (["s50"], ["s50"], ["s50"], False),
+    ],
+)
+def test_gt_type_filtered_require_ignore(fts, require, ignore, expected):
+    call = record.Call("sample", vcfpy.OrderedDict([("GT", "1/1"), ("FT", fts)]))
+    assert call.is_filtered(require=require, ignore=ignore) is expected
@@ -85,3 +85,18 @@ def test_fetch_two_records_region():
 
     assert records[1].CHROM == "20"
     assert records[1].POS == 1234567
+
+
+# Test fetching repeatedly ----------------------------------------------------
+
+
+def test_fetch_repeatedly_reuses_tabix_file():
+    path = os.path.join(os.path.dirname(__file__), "vcfs", "multi_contig.vcf.gz")
+    r = reader.Reader.from_path(path)
+
+    records = [vcf_rec for vcf_rec in r.fetch("20", 1110695, 1230236)]
+    tabix_file = r.tabix_file
+    records += [vcf_rec for vcf_rec in r.fetch("20:1,110,697-1,234,568")]
+
+    assert r.tabix_file is tabix_file
+    assert [rec.POS for rec in records] == [1110696, 1230237, 1234567]
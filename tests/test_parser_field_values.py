@@ -66,6 +66,40 @@ def test_convert_field_values_string_none():
     assert EXPECTED == RESULT
 
 
+def test_convert_field_values_string_unescape_once():
+    EXPECTED = "%3B;"
+    RESULT = parser.convert_field_value("String", "%253B%3B")
+    assert EXPECTED == RESULT
+
+
+@pytest.mark.parametrize("type_", ["Integer", "Float"])
+def test_convert_field_value_cannot_convert(type_):
+    with pytest.warns(parser.CannotConvertValue):
+        RESULT = parser.convert_field_value(type_, "x")
+    assert "x" == RESULT
+
+
+# parser.convert_field_values() -----------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "type_,values,expected",
+    [
+        ("Integer", ["1", ".", "3"], [1, None, 3]),
+        ("Float", ["1.5", "."], [1.5, None]),
+        ("String", ["x", ".", "a%3Bb"], ["x", None, "a;b"]),
+    ],
+)
+def test_convert_field_values(type_, values, expected):
+    assert expected == parser.convert_field_values(type_, values)
+
+
+def test_convert_field_values_cannot_convert():
+    with pytest.warns(parser.CannotConvertValue):
+        RESULT = parser.convert_field_values("Integer", ["1", "x", "."])
+    assert [1, "x", None] == RESULT
+
+
 # parser.parse_field_value() --------------------------------------------------
 
 
@@ -107,3 +141,33 @@ def test_parse_field_value_string_more_empty(number):
     EXPECTED = []
     RESULT = parser.parse_field_value(header.FieldInfo("String", number), ".")
     assert EXPECTED == RESULT
+
+
+# parser.make_field_value_parser() --------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "field_info,value",
+    [
+        (header.FieldInfo("Integer", 1), "42"),
+        (header.FieldInfo("Integer", 1), "."),
+        (header.FieldInfo("Float", 1), "4.2"),
+        (header.FieldInfo("Integer", "A"), "42,."),
+        (header.FieldInfo("Integer", "R"), "."),
+        (header.FieldInfo("Float", 2), "1,2.5"),
+        (header.FieldInfo("String", 1), "a%3Bb"),
+        (header.FieldInfo("String", "."), "a,b"),
+        (header.FieldInfo("Character", 1), "."),
+        (header.FieldInfo("Flag", 0), "1"),
+        (header.FieldInfo("String", 1, id_="FT"), "q10;."),
+    ],
+)
+def test_make_field_value_parser(field_info, value):
+    parse = parser.make_field_value_parser(field_info)
+    assert parser.parse_field_value(field_info, value) == parse(value)
+
+
+def test_make_field_value_parser_cannot_convert():
+    parse = parser.make_field_value_parser(header.FieldInfo("Integer", 1))
+    with pytest.warns(parser.CannotConvertValue):
+        assert "x" == parse("x")
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Test for the helper routines in the vcfpy.parser module"""
 
+import pytest
+
 from vcfpy import parser
 
 __author__ = "Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>"
@@ -58,6 +60,45 @@ def test_split_quoted_string_array_syntax_recursion():
     assert EXPECTED == parser.split_quoted_string(INPUT)
 
 
+def test_split_quoted_string_empty_fields():
+    INPUT = "foo,,bar,"
+    EXPECTED = ["foo", "", "bar", ""]
+    assert EXPECTED == parser.split_quoted_string(INPUT)
+
+
+def test_split_quoted_string_quote_after_delim():
+    INPUT = 'foo,"bar,baz",[1,2]'
+    EXPECTED = ["foo", '"bar,baz"', "[1,2]"]
+    assert EXPECTED == parser.split_quoted_string(INPUT)
+
+
+def test_split_quoted_string_custom_delim():
+    INPUT = "foo='bar;baz';(1;2)"
+    EXPECTED = ["foo='bar;baz'", "(1;2)"]
+    assert EXPECTED == parser.split_quoted_string(INPUT, delim=";", quote="'", brackets="()")
+
+
+# parser.unquote_string() -----------------------------------------------------
+
+
+def test_unquote_string_plain():
+    assert "foo, bar" == parser.unquote_string('"foo, bar"')
+
+
+def test_unquote_string_escapes():
+    INPUT = r'"say \"hi\" \\o/"'
+    EXPECTED = 'say "hi" \\o/'
+    assert EXPECTED == parser.unquote_string(INPUT)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [(r'"a\dB"', "a\\dB"), (r'"x\qy \"q\" \\ [0-9]\d+"', 'x\\qy "q" \\ [0-9]\\d+')],
+)
+def test_unquote_string_keeps_unknown_escapes(value, expected):
+    assert expected == parser.unquote_string(value)
+
+
 # parser.VCFheaderLineParser.parse_mapping() ----------------------------------
 
 
@@ -48,3 +48,31 @@ def test_substitution_indel(vcf_header):
     EXPECTED = "Substitution(type_='INDEL', value='TG')"
     RESULT = parser.process_alt(vcf_header, "AAAC", "TG")
     assert str(RESULT) == EXPECTED
+
+
+@pytest.mark.parametrize(
+    "ref,alt,expected",
+    [("C", "T", "SNV"), ("CT", "C", "DEL"), ("C", "CT", "INS"), ("CT", "G", "INDEL")],
+)
+def test_substitution_type(ref, alt, expected):
+    assert parser.substitution_type(ref, alt) == expected
+
+
+def test_substitution_not_shared(vcf_header):
+    """Substitutions must not be shared between records"""
+    assert parser.process_alt(vcf_header, "C", "T") is not parser.process_alt(vcf_header, "C", "T")
+
+
+# result type SingleBreakEnd --------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "ref,alt,expected",
+    [
+        ("C", ".", "SingleBreakEnd('+', '')"),
+        ("C", ".C", "SingleBreakEnd('+', 'C')"),
+        ("C", "C.", "SingleBreakEnd('-', 'C')"),
+    ],
+)
+def test_single_breakend(vcf_header, ref, alt, expected):
+    assert str(parser.process_alt(vcf_header, ref, alt)) == expected
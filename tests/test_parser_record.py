@@ -5,6 +5,9 @@
 import io
 import sys
 
+import pytest
+
+from vcfpy import exceptions
 from vcfpy import parser
 
 __author__ = "Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>"
@@ -178,3 +181,54 @@ def test_missing_pass(recwarn):
     RESULT = p.parse_next_record()
     assert str(RESULT) == EXPECTED
     assert list(recwarn) == []
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "20\t1\t.\tC\tG\t.\tPASS\t.\tGT\t0/1\t0/2\n",
+        "20\t1\t.\tC\tG\t.\tPASS\t.\tGT\t0/1\t0/2\t.\t0/0\n",
+    ],
+)
+def test_parse_record_wrong_column_count(line):
+    p = vcf_parser(line)
+    p.parse_header()
+    with pytest.raises(exceptions.InvalidRecordException):
+        p.parse_next_record()
+
+
+def test_parse_record_info_flags_and_key_with_space():
+    LINES = "20\t1\t.\tC\tG\t.\tPASS\tDB;H2=1; DP=14\tGT\t0/1\t0/2\t.\n"
+    p = vcf_parser(LINES)
+    p.parse_header()
+    with pytest.warns(exceptions.LeadingTrailingSpaceInKey):
+        RESULT = p.parse_next_record()
+    assert RESULT.INFO == {"DB": True, "H2": True, "DP": 14}
+
+
+def test_parse_record_lazy_calls():
+    LINES = "20\t1\t.\tC\tG\t.\tPASS\t.\tGT:FT\t0/1:.\t0/2:BAR\t.:.\n"
+    p = vcf_parser(LINES)
+    p.parse_header()
+    EXPECTED = p.parse_next_record()
+    p = parser.Parser(io.StringIO(MEDIUM_HEADER + LINES), "<builtin>", lazy_calls=True)
+    p.parse_header()
+    RESULT = p.parse_next_record()
+    assert RESULT.FORMAT == ["GT", "FT"]
+    assert RESULT._load_calls is not None
+    # the FT check for the calls only happens on first access
+    with pytest.warns(exceptions.UnknownFilter):
+        assert RESULT.call_for_sample["NA00002"].data == {"GT": "0/2", "FT": ["BAR"]}
+    assert RESULT._load_calls is None
+    assert RESULT.calls[0].site is RESULT
+    assert str(RESULT) == str(EXPECTED)
+
+
+def test_parse_record_keys_shared_between_records():
+    LINES = "20\t1\t.\tC\tG\t.\tPASS\tDP=1\tGT:GQ\t0/1:1\t0/2:2\t.:3\n" * 2
+    p = vcf_parser(LINES)
+    p.parse_header()
+    first, second = p.parse_next_record(), p.parse_next_record()
+    assert next(iter(first.INFO)) is next(iter(second.INFO))
+    assert first.FORMAT[1] is second.FORMAT[1]
+    assert first.calls[0].sample is second.calls[0].sample
@@ -2,9 +2,12 @@
 """Reading of VCF files from plain and bgzip-ed files
 """
 
+import gzip
 import io
 import os
 
+import pytest
+
 from vcfpy import reader
 
 __author__ = "Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>"
@@ -38,6 +41,45 @@ def test_read_bgzip():
     assert len(records) == 5
 
 
+def test_read_plain_gzip(tmpdir):
+    path = os.path.join(os.path.dirname(__file__), "vcfs/full_vcf43.vcf")
+    gz_path = tmpdir.join("full_vcf43.vcf.gz")
+    with open(path, "rb") as f:
+        gz_path.write(gzip.compress(f.read()), mode="wb")
+    r = reader.Reader.from_path(str(gz_path))
+    assert r.header.samples.names == ["NA00001", "NA00002", "NA00003"]
+    assert len(list(r)) == 5
+
+
+@pytest.mark.parametrize(
+    "src,dst", [("full_vcf43.vcf.gz", "misnamed.vcf"), ("full_vcf43.vcf", "misnamed.vcf.gz")]
+)
+def test_read_detects_compression_by_content(tmpdir, src, dst):
+    path = tmpdir.join(dst)
+    with open(os.path.join(os.path.dirname(__file__), "vcfs", src), "rb") as f:
+        path.write(f.read(), mode="wb")
+    r = reader.Reader.from_path(str(path))
+    assert r.header.samples.names == ["NA00001", "NA00002", "NA00003"]
+    assert len(list(r)) == 5
+
+
+def test_read_bgzip_rapidgzip(monkeypatch):
+    path = os.path.join(os.path.dirname(__file__), "vcfs/full_vcf43.vcf.gz")
+    opened = []
+
+    class FakeRapidgzip:
+        @staticmethod
+        def open(path, parallelization):
+            opened.append(path)
+            return gzip.open(path, "rb")
+
+    monkeypatch.setattr(reader, "rapidgzip", FakeRapidgzip)
+    r = reader.Reader.from_path(path)
+    assert opened == [path]
+    assert r.header.samples.names == ["NA00001", "NA00002", "NA00003"]
+    assert len(list(r)) == 5
+
+
 def test_read_text_no_samples():
     path = os.path.join(os.path.dirname(__file__), "vcfs/full_vcf43_no_samples.vcf")
     r = reader.Reader.from_path(path)
@@ -68,3 +110,21 @@ def test_read_info_flag():
     with reader.Reader.from_stream(string_buffer) as r:
         line = next(r)
         assert line.INFO["MH"]
+
+
+def test_read_stream_not_seekable():
+    """Lines from pipes are read one at a time, without batching."""
+
+    class PipeStream(io.StringIO):
+        def seekable(self):
+            return False
+
+        def readlines(self, hint=-1):
+            raise AssertionError("must not read ahead from non-seekable stream")
+
+    path = os.path.join(os.path.dirname(__file__), "vcfs/full_vcf43.vcf")
+    with open(path, "rt") as f:
+        stream = PipeStream(f.read())
+    r = reader.Reader.from_stream(stream)
+    assert r.header.samples.names == ["NA00001", "NA00002", "NA00003"]
+    assert len(list(r)) == 5
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 """Test the Record class basics."""
 
+import collections.abc
+import pickle
 import sys
 
+import pytest
+
 import vcfpy
 
 
@@ -30,3 +34,94 @@ def test_record_from_scratch():
             "Record('chr1', 1234, [], 'A', [Substitution(type_='SNV', value='T')], None, "
             "[], {}, ['GT'], [Call('sample-1', {'GT': './.'})])"
         )
+
+
+def test_record_and_call_unhashable():
+    call = vcfpy.Call("sample-1", vcfpy.OrderedDict([("GT", "0/1")]))
+    record = vcfpy.Record("chr1", 1234, [], "A", [], None, [], {}, ["GT"], [call])
+    with pytest.raises(TypeError):
+        hash(record)
+    with pytest.raises(TypeError):
+        hash(call)
+    assert not isinstance(record, collections.abc.Hashable)
+    assert not isinstance(call, collections.abc.Hashable)
+
+
+@pytest.mark.parametrize(
+    "ref,alts,expected",
+    [
+        ("A", [], (1233, 1234)),
+        ("A", [vcfpy.Substitution(vcfpy.SNV, "T")], (1233, 1234)),
+        ("AC", [vcfpy.Substitution(vcfpy.DEL, "A")], (1233, 1235)),
+        ("A", [vcfpy.Substitution(vcfpy.INS, "AC")], (1234, 1234)),
+        ("AC", [vcfpy.Substitution(vcfpy.INS, "ACT")], (1234, 1234)),
+        (
+            "A",
+            [vcfpy.Substitution(vcfpy.INS, "AC"), vcfpy.Substitution(vcfpy.INS, "AG")],
+            (1234, 1234),
+        ),
+        (
+            "A",
+            [vcfpy.Substitution(vcfpy.INS, "AC"), vcfpy.Substitution(vcfpy.SNV, "T")],
+            (1233, 1234),
+        ),
+    ],
+)
+def test_record_affected_interval(ref, alts, expected):
+    record = vcfpy.Record("chr1", 1234, [], ref, alts, None, [], {})
+    assert (record.affected_start, record.affected_end) == expected
+    assert (record.begin, record.end) == (1233, expected[1])
+
+
+def test_record_pickle_roundtrip():
+    call = vcfpy.Call("sample-1", vcfpy.OrderedDict([("GT", "0|1")]))
+    alts = [vcfpy.Substitution(vcfpy.SNV, "T"), vcfpy.BreakEnd("chr2", 10, "+", "-", "A", True)]
+    record = vcfpy.Record("chr1", 1234, [], "A", alts, None, [], {}, ["GT"], [call])
+    copy = pickle.loads(pickle.dumps(record))
+    assert str(copy) == str(record)
+    assert copy.ALT == record.ALT
+    assert copy.calls[0].site is copy
+    assert copy.calls[0].is_phased
+    with pytest.raises(AttributeError):
+        record.foo = "bar"
+
+
+def test_record_call_for_sample_follows_calls():
+    calls = [vcfpy.Call(name, vcfpy.OrderedDict([("GT", "0/1")])) for name in ("a", "b")]
+    record = vcfpy.Record("chr1", 1234, [], "A", [], None, [], {}, ["GT"], calls)
+    assert record.call_for_sample == {"a": calls[0], "b": calls[1]}
+    record.calls = calls[1:]
+    assert record.call_for_sample == {"b": calls[1]}
+
+
+@pytest.mark.parametrize(
+    "filters,expected",
+    [
+        ([], ["q10"]),
+        (["PASS"], ["q10"]),
+        (["s50"], ["s50", "q10"]),
+        (["q10"], ["q10"]),
+        (["PASS", "s50", "PASS"], ["s50", "q10"]),
+        (("s50",), ["s50", "q10"]),
+    ],
+)
+def test_record_add_filter(filters, expected):
+    original = list(filters)
+    record = vcfpy.Record("chr1", 1234, [], "A", [], None, filters, {})
+    record.add_filter("q10")
+    assert record.FILTER == expected
+    # the FILTER value passed in is never modified
+    assert list(filters) == original
+
+
+@pytest.mark.parametrize("filters,expected", [([], ["PASS"]), (["PASS"], ["PASS"])])
+def test_record_add_filter_pass(filters, expected):
+    record = vcfpy.Record("chr1", 1234, [], "A", [], None, filters, {})
+    record.add_filter("PASS")
+    assert record.FILTER == expected
+
+
+def test_record_add_filter_tuple():
+    record = vcfpy.Record("1", 5, [], "A", [], None, ("PASS",), {})
+    record.add_filter("q10")
+    assert record.FILTER == ["q10"]
@@ -133,3 +133,15 @@ def test_symbolic_allele():
     # test serialize()
     EXPECTED = "<DUP>"
     assert EXPECTED == rec.serialize()
+
+
+def test_alt_record_hash_matches_eq():
+    alts = [
+        record.Substitution(record.SNV, "T"),
+        record.Substitution(record.SNV, "T"),
+        record.SingleBreakEnd(record.FORWARD, "A"),
+        record.SingleBreakEnd(record.FORWARD, "A"),
+        record.SymbolicAllele("DUP"),
+        record.SymbolicAllele("DUP"),
+    ]
+    assert len(set(alts)) == 3
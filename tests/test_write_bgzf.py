@@ -10,6 +10,7 @@ import pytest
 
 import vcfpy
 from vcfpy import parser
+from vcfpy import bgzf
 from vcfpy import writer
 from vcfpy import record
 
@@ -154,3 +155,40 @@ def test_write_minimal_record_writer_from_stream_use_bgzf(header_samples, tmpdir
     # check the resulting record
     LINE = "20\t100\t.\tC\tT\t.\t.\t.\tGT\t0/1\t0/0\t1/1\n"
     check_file(path, LINE)
+
+
+@pytest.mark.parametrize("conv", [bytes, bytearray, memoryview])
+def test_bgzf_writer_write_bytes_like(tmpdir_factory, conv):
+    path = tmpdir_factory.mktemp("write_bytes").join("out.txt.gz")
+    with bgzf.BgzfWriter(filename=str(path)) as f:
+        f.write("first line\n")
+        f.write(conv(b"second line\n"))
+    assert gzip.decompress(path.read(mode="rb")) == b"first line\nsecond line\n"
+
+
+def test_bgzf_writer_tell(tmpdir_factory):
+    path = tmpdir_factory.mktemp("write_tell").join("out.txt.gz")
+    with bgzf.BgzfWriter(filename=str(path)) as f:
+        assert f.tell() == bgzf.make_virtual_offset(0, 0)
+        f.write("x" * 100)
+        assert f.tell() == bgzf.make_virtual_offset(0, 100)
+        f.write("x" * 65536)
+        assert f.tell() == bgzf.make_virtual_offset(f._handle.tell(), 100)
+
+
+def test_bgzf_writer_flush_empty_block_is_eof(tmpdir_factory):
+    path = tmpdir_factory.mktemp("write_flush").join("out.txt.gz")
+    with open(str(path), "wb") as handle:
+        f = bgzf.BgzfWriter(fileobj=handle)
+        f.flush()
+        assert handle.tell() == len(bgzf._bgzf_eof)
+    assert path.read(mode="rb") == bgzf._bgzf_eof
+
+
+def test_is_bgzf_header(tmpdir_factory):
+    path = tmpdir_factory.mktemp("is_bgzf").join("out.txt.gz")
+    with bgzf.BgzfWriter(filename=str(path)) as f:
+        f.write("some text\n")
+    assert bgzf.is_bgzf_header(path.read(mode="rb"))
+    assert not bgzf.is_bgzf_header(gzip.compress(b"some text\n"))
+    assert not bgzf.is_bgzf_header(b"##fileformat=VCFv4.3\n")
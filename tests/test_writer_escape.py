@@ -2,6 +2,8 @@
 """Test escaping on writing VCF records
 """
 
+import pytest
+
 from vcfpy import writer
 from vcfpy import header
 
@@ -47,3 +49,25 @@ def test_format_value_without_escape():
         header.FieldInfo("String", 2), ("This is a legal string", "me too"), "INFO"
     )
     assert EXPECTED == RESULT
+
+
+# vcfpy.writer.make_field_value_formatter() -----------------------------------
+
+
+@pytest.mark.parametrize(
+    "field_info,value,section",
+    [
+        (header.FieldInfo("Integer", 1), 42, "INFO"),
+        (header.FieldInfo("Integer", 1), None, "FORMAT"),
+        (header.FieldInfo("String", 1), "a;b", "INFO"),
+        (header.FieldInfo("String", 1), "a:b", "FORMAT"),
+        (header.FieldInfo("Float", "A"), [0.5, None], "INFO"),
+        (header.FieldInfo("String", "."), [], "INFO"),
+        (header.FieldInfo("String", 2), (":;=%,\r\n\t", "%"), "INFO"),
+        (header.FieldInfo("String", 1, id_="FT"), ["q10", "s50"], "FORMAT"),
+        (header.FieldInfo("String", 1, id_="FT"), [], "FORMAT"),
+    ],
+)
+def test_make_field_value_formatter(field_info, value, section):
+    formatter = writer.make_field_value_formatter(field_info, section)
+    assert writer.format_value(field_info, value, section) == formatter(value)
@@ -73,3 +73,20 @@ def test_write_header_no_samples(tmpdir_factory):
     """
     ).lstrip()
     assert RESULT == EXPECTED
+
+
+def test_write_header_read_back_escapes():
+    hdr = header.Header(
+        lines=[header.HeaderLine("fileformat", "VCFv4.3")], samples=header.SamplesInfos([])
+    )
+    description = 'café\tz "quoted" back\\slash'
+    hdr.add_info_line(
+        header.OrderedDict(
+            [("ID", "X"), ("Number", 1), ("Type", "String"), ("Description", description)]
+        )
+    )
+    stream = io.StringIO()
+    writer.Writer.from_stream(stream, hdr)
+    p = parser.Parser(stream=io.StringIO(stream.getvalue()), path="<builtin>")
+    p.parse_header()
+    assert p.header.get_info_field_info("X").description == description
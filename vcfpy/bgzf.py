@@ -24,8 +24,8 @@ Shamelessly taken from Biopython
 # OR OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE
 # OR PERFORMANCE OF THIS SOFTWARE.
 
-import codecs
 import struct
+import sys
 import zlib
 
 
@@ -40,6 +40,34 @@ _bgzf_eof = (
 _bytes_BC = b"BC"
 
 
+# Giving a negative window bits means no gzip/zlib headers, -15 used in
+# samtools.  Each BGZF block is an independent DEFLATE stream, so the
+# compressor cannot be reused across blocks; on Python >=3.11 the one-shot
+# ``zlib.compress`` accepts ``wbits`` and saves creating, feeding, and
+# flushing a ``compressobj`` per block.
+if sys.version_info[:2] >= (3, 11):
+
+    def _deflate_raw(data, level):
+        """Return raw DEFLATE-compressed ``data``"""
+        return zlib.compress(data, level, wbits=-15)
+
+else:
+
+    def _deflate_raw(data, level):
+        """Return raw DEFLATE-compressed ``data``"""
+        c = zlib.compressobj(level, zlib.DEFLATED, -15, zlib.DEF_MEM_LEVEL, 0)
+        return c.compress(data) + c.flush()
+
+
+def is_bgzf_header(data):
+    """Return whether the ``bytes`` in ``data`` start with a BGZF block header
+
+    This is the case if ``data`` starts with the gzip magic bytes, the
+    ``FEXTRA`` flag is set, and the first extra sub field is ``BC``.
+    """
+    return data[:4] == _bgzf_magic and data[12:14] == _bytes_BC
+
+
 def make_virtual_offset(block_start_offset, within_block_offset):
     """Compute a BGZF virtual offset from block start and within block offsets.
     The BAM indexing scheme records read positions using a 64 bit
@@ -103,20 +131,14 @@ class BgzfWriter(object):
     def _write_block(self, block):
         # print("Saving %i bytes" % len(block))
         assert len(block) <= 65536
-        # Giving a negative window bits means no gzip/zlib headers,
-        # -15 used in samtools
-        c = zlib.compressobj(self.compresslevel, zlib.DEFLATED, -15, zlib.DEF_MEM_LEVEL, 0)
-        compressed = c.compress(block) + c.flush()
-        del c
+        if not block:
+            # the compressed form of an empty block is the EOF marker
+            self._handle.write(_bgzf_eof)
+            return
+        compressed = _deflate_raw(block, self.compresslevel)
         assert len(compressed) < 65536, "TODO - Didn't compress enough, try less data in this block"
-        crc = zlib.crc32(block)
-        # Should cope with a mix of Python platforms...
-        if crc < 0:
-            crc = struct.pack("<i", crc)
-        else:
-            crc = struct.pack("<I", crc)
         bsize = struct.pack("<H", len(compressed) + 25)  # includes -1
-        crc = struct.pack("<I", zlib.crc32(block) & 0xFFFFFFFF)
+        crc = struct.pack("<I", zlib.crc32(block))  # unsigned on Python 3
         uncompressed_length = struct.pack("<I", len(block))
         # Fixed 16 bytes,
         # gzip magic bytes (4) mod time (4),
@@ -130,9 +152,14 @@ class BgzfWriter(object):
         self._handle.write(data)
 
     def write(self, data):
-        # TODO - Check bytes vs unicode
+        """Write ``data`` to the BGZF file
+
+        ``data`` can either be a ``str`` that is encoded as latin-1 or any
+        bytes-like object (``bytes``, ``bytearray``, ``memoryview``) that is
+        appended to the buffer as-is.
+        """
         if isinstance(data, str):
-            data = codecs.latin_1_encode(data)[0]
+            data = data.encode("latin-1")
         # block_size = 2**16 = 65536
         data_len = len(data)
         if len(self._buffer) + data_len < 65536:
@@ -148,8 +175,8 @@ class BgzfWriter(object):
 
     def flush(self):
         while len(self._buffer) >= 65536:
-            self._write_block(self._buffer[:65535])
-            self._buffer = self._buffer[65535:]
+            self._write_block(self._buffer[:65536])
+            self._buffer = self._buffer[65536:]
         self._write_block(self._buffer)
         self._buffer = b""
         self._handle.flush()
@@ -169,7 +196,9 @@ class BgzfWriter(object):
 
     def tell(self):
         """Returns a BGZF 64-bit virtual offset."""
-        return make_virtual_offset(self._handle.tell(), len(self._buffer))
+        # Do this inline to avoid a function call, the buffer is always
+        # flushed before it reaches 2**16 bytes.
+        return (self._handle.tell() << 16) | len(self._buffer)
 
     def seekable(self):
         # Not seekable, but we do support tell...
@@ -69,7 +69,7 @@ class FieldInfo:
         return NotImplemented
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+        return hash((self.type, self.number, self.description, self.id))
 
     def __str__(self):
         return "FieldInfo({}, {}, {}, {})".format(
@@ -2,8 +2,8 @@
 """Parsing of VCF files from ``str``
 """
 
-import ast
 import functools
+import json
 import math
 import re
 import warnings
@@ -29,10 +29,16 @@ __author__ = "Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>"
 REQUIRE_SAMPLE_HEADER = ("#CHROM", "POS", "ID", "REF", "ALT", "QUAL", "FILTER", "INFO", "FORMAT")
 # expected "#CHROM" header prefix when there are no samples
 REQUIRE_NO_SAMPLE_HEADER = ("#CHROM", "POS", "ID", "REF", "ALT", "QUAL", "FILTER", "INFO")
+# the above as lists, for comparing to slices of the split "#CHROM" line
+_REQUIRE_SAMPLE_LIST = list(REQUIRE_SAMPLE_HEADER)
+_REQUIRE_NO_SAMPLE_LIST = list(REQUIRE_NO_SAMPLE_HEADER)
 
 #: Supported VCF versions, a warning will be issued otherwise
 SUPPORTED_VCF_VERSIONS = ("VCFv4.0", "VCFv4.1", "VCFv4.2", "VCFv4.3")
 
+#: Number of characters to read ahead at once when reading lines
+READ_AHEAD_SIZE = 1 << 20
+
 
 class QuotedStringSplitter:
     """Helper class for splitting quoted strings
@@ -41,17 +47,6 @@ class QuotedStringSplitter:
     for splitting the VCF header line dicts
     """
 
-    #: state constant for normal
-    NORMAL = 0
-    #: state constant for quoted
-    QUOTED = 1
-    #: state constant for delimiter
-    ESCAPED = 2
-    #: state constant for array
-    ARRAY = 3
-    #: state constant for delimiter
-    DELIM = 4
-
     def __init__(self, delim=",", quote='"', brackets="[]"):
         #: string delimiter
         self.delim = delim
@@ -60,6 +55,16 @@ class QuotedStringSplitter:
         #: two-character string with opening and closing brackets
         assert len(brackets) == 2
         self.brackets = brackets
+        # regular expression matching one (possibly empty) field, consisting
+        # of plain characters, quoted strings, and bracketed arrays; quotes
+        # and arrays extend to the end of the string when not terminated
+        d, q, o, c = map(re.escape, (delim, quote, brackets[0], brackets[1]))
+        self._field = re.compile(
+            r"(?:[^{d}{q}{o}]|{q}(?:\\.|[^{q}\\])*(?:{q}|\\?\Z)|{o}[^{c}]*(?:{c}|\Z))*".format(
+                d=d, q=q, o=o, c=c
+            ),
+            re.DOTALL,
+        )
 
     def run(self, s):
         """Split string ``s`` at delimiter, correctly interpreting quotes
@@ -70,58 +75,24 @@ class QuotedStringSplitter:
         quoting inside of braces is not supported either.  This is just to
         support the example from VCF v4.3.
         """
-        begins, ends = [0], []
-        # transition table
-        DISPATCH = {
-            self.NORMAL: self._handle_normal,
-            self.QUOTED: self._handle_quoted,
-            self.ARRAY: self._handle_array,
-            self.DELIM: self._handle_delim,
-            self.ESCAPED: self._handle_escaped,
-        }
-        # run state automaton
-        state = self.NORMAL
-        for pos, c in enumerate(s):
-            state = DISPATCH[state](c, pos, begins, ends)
-        ends.append(len(s))
-        assert len(begins) == len(ends)
-        # Build resulting list
-        return [s[start:end] for start, end in zip(begins, ends)]
-
-    def _handle_normal(self, c, pos, begins, ends):  # pylint: disable=W0613
-        if c == self.delim:
-            ends.append(pos)
-            return self.DELIM
-        elif c == self.quote:
-            return self.QUOTED
-        elif c == self.brackets[0]:
-            return self.ARRAY
-        else:
-            return self.NORMAL
+        match = self._field.match
+        result = []
+        pos, end = 0, len(s)
+        while True:
+            m = match(s, pos)
+            result.append(m.group())
+            pos = m.end() + 1  # skip delimiter
+            if pos > end:
+                return result
 
-    def _handle_quoted(self, c, pos, begins, ends):  # pylint: disable=W0613
-        if c == "\\":
-            return self.ESCAPED
-        elif c == self.quote:
-            return self.NORMAL
-        else:
-            return self.QUOTED
 
-    def _handle_array(self, c, pos, begins, ends):  # pylint: disable=W0613
-        if c == self.brackets[1]:
-            return self.NORMAL
-        else:
-            return self.ARRAY
-
-    def _handle_delim(self, c, pos, begins, ends):  # pylint: disable=W0613
-        begins.append(pos)
-        return self.NORMAL
-
-    def _handle_escaped(self, c, pos, begins, ends):  # pylint: disable=W0613
-        return self.QUOTED
+#: splitter used by ``split_quoted_string()`` for the default arguments
+_DEFAULT_SPLITTER = QuotedStringSplitter()
 
 
 def split_quoted_string(s, delim=",", quote='"', brackets="[]"):
+    if (delim, quote, brackets) == (",", '"', "[]"):
+        return _DEFAULT_SPLITTER.run(s)
     return QuotedStringSplitter(delim, quote, brackets).run(s)
 
 
@@ -140,6 +111,26 @@ def split_mapping(pair_str):
     return key, value
 
 
+#: Regular expression for backslash escapes in quoted header values
+_QUOTED_ESCAPE = re.compile(r'\\(["\\])')
+
+
+def unquote_string(value):
+    """Remove the surrounding quotes from ``value`` and resolve backslash
+    escapes in between
+
+    The escapes written by :py:func:`vcfpy.header.serialize_for_header` (JSON
+    string escapes) are decoded; if that fails, only ``\\"`` and ``\\\\`` are
+    resolved and other backslashes are kept as written.
+    """
+    if "\\" not in value:
+        return value[1:-1]
+    try:
+        return json.loads(value, strict=False)
+    except ValueError:
+        return _QUOTED_ESCAPE.sub(r"\1", value[1:-1])
+
+
 def parse_mapping(value):
     """Parse the given VCF header line mapping
 
@@ -158,20 +149,20 @@ def parse_mapping(value):
     # split the comma-separated list into pairs, ignoring commas in quotes
     pairs = split_quoted_string(value[1:-1], delim=",", quote='"')
     # split these pairs into key/value pairs, converting flags to mappings
-    # to True
-    key_values = []
+    # to True, and collect them directly into the result
+    result = OrderedDict()
     for pair in pairs:
         if "=" in pair:
             key, value = split_mapping(pair)
             if value.startswith('"') and value.endswith('"'):
-                value = ast.literal_eval(value)
+                value = unquote_string(value)
             elif value.startswith("[") and value.endswith("]"):
                 value = [v.strip() for v in value[1:-1].split(",")]
         else:
             key, value = pair, True
-        key_values.append((key, value))
+        result[key] = value
     # return completely parsed mapping as OrderedDict
-    return OrderedDict(key_values)
+    return result
 
 
 class HeaderLineParserBase:
@@ -226,33 +217,44 @@ def build_header_parsers():
 
 
 # Field value converters
-_CONVERTERS = {
-    "Integer": int,
-    "Float": float,
-    "Flag": lambda x: True,
-    "Character": str,
-    "String": str,
-}
-
-
 def convert_field_value(type_, value):
     """Convert atomic field value according to the type"""
     if value == ".":
         return None
     elif type_ in ("Character", "String"):
         if "%" in value:
-            for k, v in record.UNESCAPE_MAPPING:
-                value = value.replace(k, v)
+            value = record.unescape_value(value)
         return value
-    else:
-        try:
-            return _CONVERTERS[type_](value)
-        except ValueError:
-            warnings.warn(
-                ("{} cannot be converted to {}, keeping as " "string.").format(value, type_),
-                CannotConvertValue,
-            )
-            return value
+    elif type_ == "Flag":
+        return True
+    try:
+        if type_ == "Integer":
+            return int(value)
+        else:
+            return float(value)
+    except ValueError:
+        warnings.warn(
+            ("{} cannot be converted to {}, keeping as " "string.").format(value, type_),
+            CannotConvertValue,
+        )
+        return value
+
+
+def convert_field_values(type_, values):
+    """Convert list of atomic field values according to the type
+
+    The type is dispatched on once for the whole list, only falling back to
+    per-value conversion with :py:func:`convert_field_value` (and its
+    warnings) for values that cannot be converted.
+    """
+    try:
+        if type_ == "Integer":
+            return [None if x == "." else int(x) for x in values]
+        elif type_ == "Float":
+            return [None if x == "." else float(x) for x in values]
+    except ValueError:
+        pass  # fall back to converting one by one below
+    return [convert_field_value(type_, x) for x in values]
 
 
 def parse_field_value(field_info, value):
@@ -267,18 +269,67 @@ def parse_field_value(field_info, value):
         if value == ".":
             return []
         else:
-            return [convert_field_value(field_info.type, x) for x in value.split(",")]
+            return convert_field_values(field_info.type, value.split(","))
+
+
+def _parse_ft_value(value):
+    """Parse value of FORMAT/FT field"""
+    return [x for x in value.split(";") if x != "."]
+
 
+def _parse_flag_value(value):
+    """Parse value of a flag field"""
+    return True
 
-# Regular expression for break-end
-BREAKEND_PATTERN = re.compile("[\\[\\]]")
+
+def make_field_value_parser(field_info):
+    """Return function for parsing a value according to ``field_info``
+
+    The returned function behaves like :py:func:`parse_field_value` with
+    ``field_info`` bound but only dispatches on the field's ID, type, and
+    number once.
+    """
+    type_ = field_info.type
+    if field_info.id == "FT":
+        return _parse_ft_value
+    elif type_ == "Flag":
+        return _parse_flag_value
+    elif field_info.number == 1:
+        if type_ not in ("Integer", "Float"):
+            return functools.partial(convert_field_value, type_)
+        converter = int if type_ == "Integer" else float
+
+        def parse_number(value):
+            if value == ".":
+                return None
+            try:
+                return converter(value)
+            except ValueError:
+                return convert_field_value(type_, value)  # keep and warn
+
+        return parse_number
+    else:
+
+        def parse_list(value):
+            if value == ".":
+                return []
+            return convert_field_values(type_, value.split(","))
+
+        return parse_list
 
 
 def parse_breakend(alt_str):
     """Parse breakend and return tuple with results, parameters for BreakEnd
     constructor
     """
-    arr = BREAKEND_PATTERN.split(alt_str)
+    # Split into the parts before, between, and after the brackets around
+    # the mate position using index scans; the closing one may be missing
+    bracket = "[" if "[" in alt_str else "]"
+    begin = alt_str.index(bracket)
+    end = alt_str.find(bracket, begin + 1)
+    if end == -1:
+        end = len(alt_str)
+    arr = (alt_str[:begin], alt_str[begin + 1 : end], alt_str[end + 1 :])
     mate_chrom, mate_pos = arr[1].split(":", 1)
     mate_pos = int(mate_pos)
     if mate_chrom[0] == "<":
@@ -296,53 +347,50 @@ def parse_breakend(alt_str):
     return (mate_chrom, mate_pos, orientation, mate_orientation, sequence, within_main_assembly)
 
 
-def process_sub_grow(ref, alt_str):
-    """Process substution where the string grows"""
-    if len(alt_str) == 0:
-        raise exceptions.InvalidRecordException("Invalid VCF, empty ALT")
-    elif len(alt_str) == 1:
-        if ref[0] == alt_str[0]:
-            return record.Substitution(record.DEL, alt_str)
-        else:
-            return record.Substitution(record.INDEL, alt_str)
-    else:
-        return record.Substitution(record.INDEL, alt_str)
-
+@functools.lru_cache(maxsize=4096)
+def substitution_type(ref, alt_str):
+    """Return the type (``SNV``, ``MNV``, ``DEL``, ``INS``, or ``INDEL``) of
+    the substitution of ``ref`` by ``alt_str``
 
-def process_sub_shrink(ref, alt_str):
-    """Process substution where the string shrink"""
-    if len(ref) == 0:
-        raise exceptions.InvalidRecordException("Invalid VCF, empty REF")
-    elif len(ref) == 1:
-        if ref[0] == alt_str[0]:
-            return record.Substitution(record.INS, alt_str)
+    The result only depends on the two strings and is memoized, most calls
+    are for a small number of short REF/ALT combinations.
+    """
+    if len(ref) == len(alt_str):
+        if len(ref) == 1:
+            return record.SNV
         else:
-            return record.Substitution(record.INDEL, alt_str)
-    else:
-        return record.Substitution(record.INDEL, alt_str)
+            return record.MNV
+    elif len(ref) > len(alt_str):  # the string grows
+        if len(alt_str) == 0:
+            raise exceptions.InvalidRecordException("Invalid VCF, empty ALT")
+        elif len(alt_str) == 1 and ref[0] == alt_str[0]:
+            return record.DEL
+        else:
+            return record.INDEL
+    else:  # len(ref) < len(alt_str), the string shrinks
+        if len(ref) == 0:
+            raise exceptions.InvalidRecordException("Invalid VCF, empty REF")
+        elif len(ref) == 1 and ref[0] == alt_str[0]:
+            return record.INS
+        else:
+            return record.INDEL
 
 
 def process_sub(ref, alt_str):
     """Process substitution"""
-    if len(ref) == len(alt_str):
-        if len(ref) == 1:
-            return record.Substitution(record.SNV, alt_str)
-        else:
-            return record.Substitution(record.MNV, alt_str)
-    elif len(ref) > len(alt_str):
-        return process_sub_grow(ref, alt_str)
-    else:  # len(ref) < len(alt_str):
-        return process_sub_shrink(ref, alt_str)
+    return record.Substitution(substitution_type(ref, alt_str), alt_str)
 
 
 def process_alt(header, ref, alt_str):  # pylint: disable=W0613
     """Process alternative value using Header in ``header``"""
     # By its nature, this function contains a large number of case distinctions
-    if "]" in alt_str or "[" in alt_str:
+    if len(alt_str) == 1 and len(ref) == 1 and alt_str not in "[].":
+        return record.Substitution(record.SNV, alt_str)  # fast path for SNVs
+    elif "]" in alt_str or "[" in alt_str:
         return record.BreakEnd(*parse_breakend(alt_str))
-    elif alt_str[0] == "." and len(alt_str) > 0:
+    elif alt_str[0] == ".":
         return record.SingleBreakEnd(record.FORWARD, alt_str[1:])
-    elif alt_str[-1] == "." and len(alt_str) > 0:
+    elif alt_str[-1] == ".":
         return record.SingleBreakEnd(record.REVERSE, alt_str[:-1])
     elif alt_str[0] == "<" and alt_str[-1] == ">":
         inner = alt_str[1:-1]
@@ -386,22 +434,52 @@ class HeaderParser:
 class RecordParser:
     """Helper class for parsing VCF records"""
 
-    def __init__(self, header, samples, record_checks=None):
+    def __init__(self, header, samples, record_checks=None, lazy_calls=False):
         #: Header with the meta information
         self.header = header
         #: SamplesInfos with sample information
         self.samples = samples
         #: The checks to perform, can contain 'INFO' and 'FORMAT'
         self.record_checks = tuple(record_checks or [])
+        #: Whether to defer parsing of the calls until first access
+        self.lazy_calls = lazy_calls
         # Expected number of fields
         if self.samples.names:
             self.expected_fields = 9 + len(self.samples.names)
         else:
             self.expected_fields = 8
-        # Cache of FieldInfo objects by FORMAT string
+        # Flags whether the call of each sample is to be parsed
+        self._is_parsed = [self.samples.is_parsed(name) for name in self.samples.names]
+        # Column indices of the samples to parse if only a subset is parsed
+        if all(self._is_parsed):
+            self._parsed_indices = None
+        else:
+            self._parsed_indices = [i for i, is_parsed in enumerate(self._is_parsed) if is_parsed]
+        # Cache of FORMAT keys and value parsers by FORMAT string
         self._format_cache = {}
+        # FieldInfo objects and value parsers for INFO/FORMAT fields defined
+        # in the header, see make_field_value_parser(); fields missing from
+        # the header go through the header's lookup (and warning) each time
+        self._info_infos = {key: header.get_info_field_info(key) for key in header.info_ids()}
+        self._info_parsers = {
+            key: make_field_value_parser(info) for key, info in self._info_infos.items()
+        }
+        self._format_parsers = {
+            key: make_field_value_parser(header.get_format_field_info(key))
+            for key in header.format_ids()
+        }
+        # Header INFO/FORMAT IDs, for storing these instead of the equal
+        # strings split off each record line
+        self._interned_keys = {key: key for key in self._info_infos}
+        self._interned_keys.update((key, key) for key in self._format_parsers)
+        # IDs of the INFO flags defined in the header
+        self._flag_ids = frozenset(
+            key for key, info in self._info_infos.items() if info.type == "Flag"
+        )
         # Cache of FILTER entries, also applied to FORMAT/FT
         self._filter_ids = set(self.header.filter_ids())
+        # FILTER entries that need no warning, including the implicit PASS
+        self._known_filters = self._filter_ids | {"PASS"}
         # Helper for checking INFO fields
         if "INFO" in self.record_checks:
             self._info_checker = InfoChecker(self.header)
@@ -421,38 +499,34 @@ class RecordParser:
         if not line_str:
             return None  # empty line, EOF
         arr = self._split_line(line_str)
-        # CHROM
-        chrom = arr[0]
+        # Bind the fixed columns to local names, avoids repeated indexing
+        chrom, pos, ids, ref, alt_str, qual, filter_str, info_str = arr[:8]
         # POS
-        pos = int(arr[1])
+        pos = int(pos)
         # IDS
-        if arr[2] == ".":
-            ids = []
-        else:
-            ids = arr[2].split(";")
-        # REF
-        ref = arr[3]
+        ids = [] if ids == "." else ids.split(";")
         # ALT
-        alts = []
-        if arr[4] != ".":
-            for alt in arr[4].split(","):
-                alts.append(process_alt(self.header, ref, alt))
+        if alt_str == ".":
+            alts = []
+        else:
+            header = self.header
+            alts = [process_alt(header, ref, alt) for alt in alt_str.split(",")]
         # QUAL
-        if arr[5] == ".":
+        if qual == ".":
             qual = None
         else:
             try:
-                qual = int(arr[5])
+                qual = int(qual)
             except ValueError:  # try as float
-                qual = float(arr[5])
+                qual = float(qual)
         # FILTER
-        if arr[6] == ".":
+        if filter_str == ".":
             filt = []
         else:
-            filt = arr[6].split(";")
-        self._check_filters(filt, "FILTER")
+            filt = filter_str.split(";")
+            self._check_filters(filt, "FILTER")
         # INFO
-        info = self._parse_info(arr[7], len(alts))
+        info = self._parse_info(info_str, len(alts))
         if len(arr) == 9:
             raise exceptions.IncorrectVCFFormat("Expected 8 or 10+ columns, got 9!")
         elif len(arr) == 8:
@@ -460,30 +534,66 @@ class RecordParser:
             calls = None
         else:
             # FORMAT
-            format_ = arr[8].split(":")
+            keys, parsers = self._get_format_columns(arr[8])
+            format_ = list(keys)
+            if self.lazy_calls:
+                # sample/call columns, parsed on first access
+                rec = record.Record._from_parsed(
+                    chrom, pos, ids, ref, alts, qual, filt, info, format_
+                )
+                rec.set_calls_loader(
+                    functools.partial(self._handle_calls, alts, keys, parsers, arr)
+                )
+                return rec
             # sample/call columns
-            calls = self._handle_calls(alts, format_, arr[8], arr)
-        return record.Record(chrom, pos, ids, ref, alts, qual, filt, info, format_, calls)
+            calls = self._handle_calls(alts, keys, parsers, arr)
+        return record.Record._from_parsed(
+            chrom, pos, ids, ref, alts, qual, filt, info, format_, calls
+        )
 
-    def _handle_calls(self, alts, format_, format_str, arr):
+    def _get_format_columns(self, format_str):
+        """Return pair of parallel tuples with the keys and value parsers
+        for ``format_str``, cached by the FORMAT string
+        """
+        result = self._format_cache.get(format_str)
+        if result is None:
+            interned_keys = self._interned_keys
+            keys = tuple(interned_keys.get(key, key) for key in format_str.split(":"))
+            parsers = tuple(
+                self._format_parsers.get(key)
+                or make_field_value_parser(self.header.get_format_field_info(key))
+                for key in keys
+            )
+            result = self._format_cache[format_str] = (keys, parsers)
+        return result
+
+    def _handle_calls(self, alts, keys, parsers, arr):
         """Handle FORMAT and calls columns, factored out of parse_line"""
-        if format_str not in self._format_cache:
-            self._format_cache[format_str] = list(map(self.header.get_format_field_info, format_))
+        # hoist loop invariants out of the per-sample loop
+        num_alts = len(alts)
+        has_ft = "FT" in keys
+        parse_data = self._parse_calls_data
+        check_format = self._format_checker.run
+        names = self.samples.names
+        if self._parsed_indices is None:
+            indices = range(len(names))
+            calls = [None] * len(names)
+        else:
+            # only visit the parsed samples, keep the others as they are
+            indices = self._parsed_indices
+            calls = list(map(record.UnparsedCall, names, arr[9:]))
         # per-sample calls
-        calls = []
-        for sample, raw_data in zip(self.samples.names, arr[9:]):
-            if self.samples.is_parsed(sample):
-                data = self._parse_calls_data(format_, self._format_cache[format_str], raw_data)
-                call = record.Call(sample, data)
-                self._format_checker.run(call, len(alts))
-                self._check_filters(call.data.get("FT"), "FORMAT/FT", call.sample)
-                calls.append(call)
-            else:
-                calls.append(record.UnparsedCall(sample, raw_data))
+        for i in indices:
+            sample = names[i]
+            call = record.Call(sample, parse_data(keys, parsers, arr[9 + i]))
+            check_format(call, num_alts)
+            if has_ft:
+                self._check_filters(call.data.get("FT"), "FORMAT/FT", sample)
+            calls[i] = call
         return calls
 
     def _check_filters(self, filt, source, sample=None):
-        if not filt:
+        if not filt or self._known_filters.issuperset(filt):
             return
         for f in filt:
             self._check_filter(f, source, sample)
@@ -508,13 +618,18 @@ class RecordParser:
                 )
 
     def _split_line(self, line_str):
-        """Split line and check number of columns"""
-        arr = line_str.rstrip().split("\t")
-        if len(arr) != self.expected_fields:
+        """Split line with trailing whitespace already removed and check
+        number of columns
+        """
+        # Cap the number of splits, surplus columns end up in the last field
+        arr = line_str.split("\t", self.expected_fields - 1)
+        if len(arr) != self.expected_fields or "\t" in arr[-1]:
             raise exceptions.InvalidRecordException(
                 (
                     "The line contains an invalid number of fields. Was "
-                    "{} but expected {}\n{}".format(len(arr), 9 + len(self.samples.names), line_str)
+                    "{} but expected {}\n{}".format(
+                        line_str.count("\t") + 1, self.expected_fields, line_str
+                    )
                 )
             )
         return arr
@@ -527,29 +642,45 @@ class RecordParser:
         # The standard is very nice to parsers, we can simply split at
         # semicolon characters, although I (Manuel) don't know how strict
         # programs follow this
+        info_parsers = self._info_parsers
+        flag_ids = self._flag_ids
+        check = self._info_checker.run
+        interned_keys = self._interned_keys
         for entry in info_str.split(";"):
-            if "=" not in entry:  # flag
-                key = entry
-                result[key] = parse_field_value(self.header.get_info_field_info(key), True)
+            key, sep, value = entry.partition("=")
+            key = interned_keys.get(key, key)
+            if key in flag_ids:
+                value = True
+            elif not sep:  # flag, but not declared as one in the header
+                info = self._info_infos.get(key) or self.header.get_info_field_info(key)
+                value = parse_field_value(info, True)
             else:
-                key, value = split_mapping(entry)
-                result[key] = parse_field_value(self.header.get_info_field_info(key), value)
-            self._info_checker.run(key, result[key], num_alts)
+                if key.strip() != key:
+                    key, value = split_mapping(entry)  # strip and warn
+                parse = info_parsers.get(key)
+                if parse:
+                    value = parse(value)
+                else:
+                    value = parse_field_value(self.header.get_info_field_info(key), value)
+            result[key] = value
+            check(key, value, num_alts)
         return result
 
     @classmethod
-    def _parse_calls_data(klass, format_, infos, gt_str):
+    def _parse_calls_data(klass, keys, parsers, gt_str):
         """Parse genotype call information from arrays using format array
 
-        :param list format: List of strings with format names
+        :param tuple keys: FORMAT keys
+        :param tuple parsers: value parsers for ``keys``, see
+            :py:func:`make_field_value_parser`
         :param gt_str arr: string with genotype information values
         """
         data = OrderedDict()
         # The standard is very nice to parsers, we can simply split at
         # colon characters, although I (Manuel) don't know how strict
         # programs follow this
-        for key, info, value in zip(format_, infos, gt_str.split(":")):
-            data[key] = parse_field_value(info, value)
+        for key, parse, value in zip(keys, parsers, gt_str.split(":")):
+            data[key] = parse(value)
         return data
 
 
@@ -680,6 +811,16 @@ class FormatChecker:
             )
 
 
+def is_seekable(stream):
+    """Return whether ``stream`` is seekable, e.g., a regular file and not a
+    pipe
+    """
+    try:
+        return stream.seekable()
+    except (AttributeError, ValueError):  # no file-like object or closed
+        return False
+
+
 class Parser:
     """Class for line-wise parsing of VCF files
 
@@ -688,17 +829,26 @@ class Parser:
     :param stream: ``file``-like object to read from
     :param str path: path the VCF is parsed from, for display purposes
         only, optional
+    :param bool lazy_calls: whether to defer parsing of the calls of a
+        record until its ``calls`` are first accessed
     """
 
-    def __init__(self, stream, path=None, record_checks=None):
+    def __init__(self, stream, path=None, record_checks=None, lazy_calls=False):
         self.stream = stream
         self.path = path
         #: checks to perform, can contain 'INFO' and 'FORMAT'
         self.record_checks = tuple(record_checks or [])
+        #: whether to defer parsing of the calls until first access
+        self.lazy_calls = lazy_calls
         #: header, once it has been read
         self.header = None
+        # lines read ahead from the stream in reverse order, see _next_line()
+        self._lines = []
+        # only read ahead from regular (seekable) files, lines arriving
+        # through pipes are handed out as soon as they are available
+        self._read_ahead = is_seekable(stream)
         # the currently read line
-        self._line = stream.readline()  # trailing '\n'
+        self._line = self._next_line()  # trailing '\n'
         #: :py:class:`vcfpy.header.SamplesInfos` with sample information;
         #: set on parsing the header
         self.samples = None
@@ -707,10 +857,28 @@ class Parser:
         # helper for checking the header
         self._header_checker = HeaderChecker()
 
+    def _next_line(self):
+        """Return next line from the stream or ``""`` at the end
+
+        Lines are read in batches of about ``READ_AHEAD_SIZE`` characters to
+        avoid one ``readline()`` call per record, unless the stream is not
+        seekable.
+        """
+        if not self._read_ahead:
+            return self.stream.readline()
+        elif not self._lines:
+            self._lines = self.stream.readlines(READ_AHEAD_SIZE)
+            if not self._lines:
+                return ""
+            self._lines.reverse()
+        return self._lines.pop()
+
     def _read_next_line(self):
         """Read next line store in self._line and return old one"""
         prev_line = self._line
-        self._line = self.stream.readline()
+        # take from the read-ahead batch directly, only call into
+        # _next_line() for reading the next batch
+        self._line = self._lines.pop() if self._lines else self._next_line()
         return prev_line
 
     def parse_header(self, parsed_samples=None):
@@ -736,7 +904,9 @@ class Parser:
         # check header for consistency
         self._header_checker.run(self.header)
         # construct record parser
-        self._record_parser = RecordParser(self.header, self.samples, self.record_checks)
+        self._record_parser = RecordParser(
+            self.header, self.samples, self.record_checks, self.lazy_calls
+        )
         # read next line, must not be header
         self._read_next_line()
         if self._line and self._line.startswith("#"):
@@ -751,7 +921,9 @@ class Parser:
             raise exceptions.IncorrectVCFFormat('Missing line starting with "#CHROM"')
         # check for space before INFO
         line = self._line.rstrip()
-        pos = line.find("FORMAT") if ("FORMAT" in line) else line.find("INFO")
+        pos = line.find("FORMAT")
+        if pos == -1:
+            pos = line.find("INFO")
         if pos == -1:
             raise exceptions.IncorrectVCFFormat('Ill-formatted line starting with "#CHROM"')
         if " " in line[:pos]:
@@ -762,23 +934,23 @@ class Parser:
                 ),
                 SpaceInChromLine,
             )
-            arr = self._line.rstrip().split()
+            arr = line.split()
         else:
-            arr = self._line.rstrip().split("\t")
+            arr = line.split("\t")
 
         self._check_samples_line(arr)
-        return header.SamplesInfos(arr[len(REQUIRE_SAMPLE_HEADER) :], parsed_samples)
+        return header.SamplesInfos(arr[len(_REQUIRE_SAMPLE_LIST) :], parsed_samples)
 
     @classmethod
     def _check_samples_line(klass, arr):
         """Peform additional check on samples line"""
-        if len(arr) <= len(REQUIRE_NO_SAMPLE_HEADER):
-            if tuple(arr) != REQUIRE_NO_SAMPLE_HEADER:
+        if len(arr) <= len(_REQUIRE_NO_SAMPLE_LIST):
+            if arr != _REQUIRE_NO_SAMPLE_LIST:
                 raise exceptions.IncorrectVCFFormat(
                     "Sample header line indicates no sample but does not "
                     "equal required prefix {}".format("\t".join(REQUIRE_NO_SAMPLE_HEADER))
                 )
-        elif tuple(arr[: len(REQUIRE_SAMPLE_HEADER)]) != REQUIRE_SAMPLE_HEADER:
+        elif arr[: len(_REQUIRE_SAMPLE_LIST)] != _REQUIRE_SAMPLE_LIST:
             raise exceptions.IncorrectVCFFormat(
                 'Sample header line (starting with "#CHROM") does not '
                 "start with required prefix {}".format("\t".join(REQUIRE_SAMPLE_HEADER))
@@ -795,7 +967,7 @@ class Parser:
         :raises: ``vcfpy.exceptions.InvalidRecordException`` in the case of
             problems reading the record
         """
-        return self.parse_line(self._read_next_line())
+        return self._record_parser.parse_line(self._read_next_line())
 
     def print_warn_summary(self):
         """If there were any warnings, print summary with warnings"""
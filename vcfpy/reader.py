@@ -3,14 +3,64 @@
 """
 
 import gzip
+import io
 import os
 
 import pysam
 
+try:
+    import rapidgzip
+except ImportError:  # optional, only used for speedup
+    rapidgzip = None
+
+from . import bgzf
 from . import parser
 
 __author__ = "Manuel Holtgrewe <manuel.holtgrewe@bihealth.de>"
 
+#: Magic bytes at the start of gzip (and thus also BGZF) files
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def read_file_start(path, size):
+    """Return the first ``size`` bytes of the file at ``path`` or ``None``
+    if it is not a regular file, e.g., a named pipe that must not be read
+    from twice
+    """
+    if not os.path.isfile(path):
+        return None
+    with open(path, "rb") as f:
+        return f.read(size)
+
+
+def is_gzip_path(path):
+    """Return whether the file at ``path`` is gzip-compressed
+
+    Regular files are recognized by their magic bytes, otherwise the
+    ``.gz``/``.bgz`` suffix decides.
+    """
+    start = read_file_start(path, len(GZIP_MAGIC))
+    if start is None:
+        return path.endswith(".gz") or path.endswith(".bgz")
+    return start == GZIP_MAGIC
+
+
+def open_gzip_text(path):
+    """Open the gzip-compressed file at ``path`` for reading text
+
+    If the optional ``rapidgzip`` package is installed, it is used for
+    decompressing with multiple threads.  Otherwise, BGZF files are read
+    with ``pysam.BGZFile`` (htslib) and other files with
+    :py:func:`gzip.open`.
+    """
+    if rapidgzip is not None:
+        return io.TextIOWrapper(rapidgzip.open(path, parallelization=os.cpu_count()))
+    start = read_file_start(path, 16)
+    if start is not None and bgzf.is_bgzf_header(start):
+        return io.TextIOWrapper(pysam.BGZFile(path, "rb"))
+    else:
+        return gzip.open(path, "rt")
+
 
 class Reader:
     """Class for parsing of files from ``file``-like objects
@@ -38,7 +88,13 @@ class Reader:
 
     @classmethod
     def from_stream(
-        klass, stream, path=None, tabix_path=None, record_checks=None, parsed_samples=None
+        klass,
+        stream,
+        path=None,
+        tabix_path=None,
+        record_checks=None,
+        parsed_samples=None,
+        lazy_calls=False,
     ):
         """Create new :py:class:`Reader` from file
 
@@ -53,6 +109,10 @@ class Reader:
         :param list parsed_samples: ``list`` of ``str`` values with names of
             samples to parse call information for (for speedup); leave to
             ``None`` for ignoring
+        :param bool lazy_calls: defer parsing the call information of each
+            record until its ``calls`` are first accessed (for speedup when
+            only few records' calls are used); note that warnings and checks
+            for the calls are then also deferred
         """
         record_checks = record_checks or []
         if tabix_path and not path:
@@ -63,10 +123,13 @@ class Reader:
             tabix_path=tabix_path,
             record_checks=record_checks,
             parsed_samples=parsed_samples,
+            lazy_calls=lazy_calls,
         )
 
     @classmethod
-    def from_path(klass, path, tabix_path=None, record_checks=None, parsed_samples=None):
+    def from_path(
+        klass, path, tabix_path=None, record_checks=None, parsed_samples=None, lazy_calls=False
+    ):
         """Create new :py:class:`Reader` from path
 
         .. note::
@@ -80,11 +143,13 @@ class Reader:
             if not given
         :param list record_checks: record checks to perform, can contain
             'INFO' and 'FORMAT'
+        :param bool lazy_calls: defer parsing the call information of each
+            record until its ``calls`` are first accessed
         """
         record_checks = record_checks or []
         path = str(path)
-        if path.endswith(".gz") or path.endswith(".bgz"):
-            f = gzip.open(path, "rt")
+        if is_gzip_path(path):
+            f = open_gzip_text(path)
             if not tabix_path:
                 tabix_path = path + ".tbi"
                 if not os.path.exists(tabix_path):
@@ -97,9 +162,18 @@ class Reader:
             tabix_path=tabix_path,
             record_checks=record_checks,
             parsed_samples=parsed_samples,
+            lazy_calls=lazy_calls,
         )
 
-    def __init__(self, stream, path=None, tabix_path=None, record_checks=None, parsed_samples=None):
+    def __init__(
+        self,
+        stream,
+        path=None,
+        tabix_path=None,
+        record_checks=None,
+        parsed_samples=None,
+        lazy_calls=False,
+    ):
         #: stream (``file``-like object) to read from
         self.stream = stream
         #: optional ``str`` with the path to the stream
@@ -110,13 +184,18 @@ class Reader:
         self.record_checks = tuple(record_checks or [])
         #: if set, list of samples to parse for
         self.parsed_samples = parsed_samples
+        #: whether to defer parsing of the calls until first access
+        self.lazy_calls = lazy_calls
         #: the ``pysam.TabixFile`` used for reading from index bgzip-ed VCF;
         #: constructed on the fly
         self.tabix_file = None
         # the iterator through the Tabix file to use
         self.tabix_iter = None
         #: the parser to use
-        self.parser = parser.Parser(stream, self.path, self.record_checks)
+        self.parser = parser.Parser(stream, self.path, self.record_checks, self.lazy_calls)
+        # function returning the next record or ``None`` at the end, switched
+        # to reading from the tabix iterator by fetch()
+        self._next_record = self.parser.parse_next_record
         #: the Header
         self.header = self.parser.parse_header(parsed_samples)
 
@@ -132,10 +211,7 @@ class Reader:
         """
         if begin is not None and end is None:
             raise ValueError("begin and end must both be None or neither")
-        # close tabix file if any and is open
-        if self.tabix_file and not self.tabix_file.closed:
-            self.tabix_file.close()
-        # open tabix file if not yet open
+        # open tabix file if not yet open, it is kept open for later calls
         if not self.tabix_file or self.tabix_file.closed:
             self.tabix_file = pysam.TabixFile(filename=self.path, index=self.tabix_path)
         # jump to the next position
@@ -143,6 +219,7 @@ class Reader:
             self.tabix_iter = self.tabix_file.fetch(region=chrom_or_region)
         else:
             self.tabix_iter = self.tabix_file.fetch(reference=chrom_or_region, start=begin, end=end)
+        self._next_record = self._next_tabix_record
         return self
 
     def close(self):
@@ -169,11 +246,13 @@ class Reader:
             problems reading the record
         :raises: ``StopException`` if at end
         """
-        if self.tabix_iter:
-            return self.parser.parse_line(str(next(self.tabix_iter)))
+        result = self._next_record()
+        if result is None:
+            raise StopIteration()
         else:
-            result = self.parser.parse_next_record()
-            if result is None:
-                raise StopIteration()
-            else:
-                return result
+            return result
+
+    def _next_tabix_record(self):
+        """Return next record from the tabix iterator, ``None`` at the end"""
+        # without a row parser, pysam yields the lines as str already
+        return self.parser.parse_line(next(self.tabix_iter, ""))
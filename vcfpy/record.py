@@ -5,6 +5,8 @@ The VCF record structure is modeled after the one of PyVCF
 """
 
 import re
+import sys
+from array import array
 
 
 #: Code for single nucleotide variant allele
@@ -36,6 +38,11 @@ HOM_ALT = 2
 
 #: Characters reserved in VCF, have to be escaped in INFO fields
 RESERVED_CHARS = {"INFO": ";%,\r\n\t", "FORMAT": ":=%,\r\n\t"}
+#: Regular expressions matching any of the reserved characters
+RESERVED_PATTERNS = {
+    section: re.compile("[{}]".format(re.escape(chars)))
+    for section, chars in RESERVED_CHARS.items()
+}
 #: Mapping for escaping reserved characters
 ESCAPE_MAPPING = [
     ("%", "%25"),
@@ -49,6 +56,27 @@ ESCAPE_MAPPING = [
 ]
 #: Mapping from escaped characters to reserved one
 UNESCAPE_MAPPING = [(v, k) for k, v in ESCAPE_MAPPING]
+#: Translation table for escaping all reserved characters in one pass
+ESCAPE_TABLE = str.maketrans(dict(ESCAPE_MAPPING))
+#: Regular expression matching the escaped reserved characters
+UNESCAPE_PATTERN = re.compile("|".join(re.escape(k) for k, _ in UNESCAPE_MAPPING))
+
+
+def escape_value(value):
+    """Return ``str`` ``value`` with all reserved characters escaped"""
+    return value.translate(ESCAPE_TABLE)
+
+
+def _unescape_match(match, unescape=dict(UNESCAPE_MAPPING)):
+    return unescape[match.group(0)]
+
+
+def unescape_value(value):
+    """Return ``str`` ``value`` with all escaped reserved characters unescaped
+
+    The value is processed in one pass, so "%253B" becomes "%3B" and not ";".
+    """
+    return UNESCAPE_PATTERN.sub(_unescape_match, value)
 
 
 class Record:
@@ -57,6 +85,23 @@ class Record:
     Record objects are iterators of their calls
     """
 
+    __slots__ = (
+        "CHROM",
+        "POS",
+        "begin",
+        "end",
+        "ID",
+        "REF",
+        "ALT",
+        "QUAL",
+        "FILTER",
+        "INFO",
+        "FORMAT",
+        "_calls",
+        "_call_for_sample",
+        "_load_calls",
+    )
+
     def __init__(self, CHROM, POS, ID, REF, ALT, QUAL, FILTER, INFO, FORMAT=None, calls=None):
         if bool(FORMAT) != bool(calls):
             raise ValueError("Either provide both FORMAT and calls or none.")
@@ -66,14 +111,16 @@ class Record:
         self.POS = POS
         #: An ``int`` with a 0-based begin position
         self.begin = POS - 1
-        #: An ``int`` with a 0-based end position
-        self.end = None  # XXX
         #: A list of the semicolon-separated values of the ID column
         self.ID = list(ID)
         #: A ``str`` with the REF value
         self.REF = REF
         #: A list of alternative allele records of type :py:class:`AltRecord`
         self.ALT = list(ALT)
+        #: An ``int`` with the 0-based end position, the value of
+        #: :py:attr:`~Record.affected_end` at construction; not updated when
+        #: ``POS``, ``REF``, or ``ALT`` change later on
+        self.end = self.affected_end
         #: The quality value, can be ``None``
         self.QUAL = QUAL
         #: A list of strings for the FILTER column
@@ -87,19 +134,119 @@ class Record:
         #: A list of genotype :py:class:`Call` objects.  Optional, must be given if
         #: and only if ``FORMAT`` is also given.
         self.calls = calls or []
-        #: A mapping from sample name to entry in self.calls.
-        self.call_for_sample = {}
         self.update_calls(self.calls)
 
+    @classmethod
+    def _from_parsed(klass, CHROM, POS, ID, REF, ALT, QUAL, FILTER, INFO, FORMAT=None, calls=None):
+        """Construct record from lists freshly built by the parser
+
+        In contrast to the constructor, ``ID`` and ``ALT`` are not copied and
+        the consistency of ``FORMAT`` and ``calls`` is not checked.
+        """
+        self = klass.__new__(klass)
+        self.CHROM = CHROM
+        self.POS = POS
+        self.begin = POS - 1
+        self.ID = ID
+        self.REF = REF
+        self.ALT = ALT
+        self.end = self.affected_end
+        self.QUAL = QUAL
+        self.FILTER = FILTER
+        self.INFO = INFO
+        self.FORMAT = FORMAT or []
+        self.calls = calls or []
+        self.update_calls(self._calls)
+        return self
+
+    @property
+    def calls(self):
+        """A list of genotype :py:class:`Call` objects"""
+        if self._load_calls is not None:
+            self._run_load_calls()
+        return self._calls
+
+    @calls.setter
+    def calls(self, calls):
+        self._load_calls = None
+        self._calls = calls
+        self._call_for_sample = None
+
+    @property
+    def call_for_sample(self):
+        """A mapping from sample name to entry in self.calls, built on first
+        access
+        """
+        if self._load_calls is not None:
+            self._run_load_calls()
+        if self._call_for_sample is None:
+            self._call_for_sample = {call.sample: call for call in self._calls}
+        return self._call_for_sample
+
+    @call_for_sample.setter
+    def call_for_sample(self, call_for_sample):
+        self._call_for_sample = call_for_sample
+
+    def set_calls_loader(self, load_calls):
+        """Defer construction of ``self.calls`` until first access
+
+        :param load_calls: callable without arguments returning the list of
+            :py:class:`Call` objects, called at most once on first access to
+            ``calls`` or ``call_for_sample``
+        """
+        self._load_calls = load_calls
+
+    def _run_load_calls(self):
+        """Construct ``self.calls`` using the loader given to
+        :py:meth:`~Record.set_calls_loader`
+        """
+        load_calls, self._load_calls = self._load_calls, None
+        self._calls = load_calls()
+        self.update_calls(self._calls)
+
     def update_calls(self, calls):
         """Update ``self.calls`` and other fields as necessary."""
         for call in calls:
             call.site = self
-        self.call_for_sample = {call.sample: call for call in calls}
+        if calls is self._calls:
+            # built on first access of ``call_for_sample``
+            self._call_for_sample = None
+        else:
+            self._call_for_sample = {call.sample: call for call in calls}
 
     def is_snv(self):
         """Return ``True`` if it is a SNV"""
-        return len(self.REF) == 1 and all(a.type == "SNV" for a in self.ALT)
+        return len(self.REF) == 1 and all(a.type == SNV for a in self.ALT)
+
+    def gt_types(self):
+        """Return the genotype types of all calls in one compact array
+
+        :return: ``array.array`` of signed bytes, giving the
+            :py:attr:`Call.gt_type` (``HOM_REF``, ``HET``, or ``HOM_ALT``) of
+            each entry in ``self.calls`` and ``-1`` for calls that are not
+            called or were not parsed
+        """
+        result = array("b", [-1]) * len(self.calls)
+        for i, call in enumerate(self.calls):
+            if isinstance(call, Call):
+                gt_type = call.gt_type
+                if gt_type is not None:
+                    result[i] = gt_type
+        return result
+
+    def sparse_gt_types(self):
+        """Return the genotype types of all calls that are not ``HOM_REF``
+
+        :return: pair of ``array.array`` objects, the indices into
+            ``self.calls`` (signed ints) and their values as returned by
+            :py:meth:`~Record.gt_types`, e.g., for building a sparse matrix
+        """
+        indices, values = array("i"), array("b")
+        for i, gt_type in enumerate(self.gt_types()):
+            if gt_type != HOM_REF:
+                indices.append(i)
+                values.append(gt_type)
+        return indices, values
 
     @property
     def affected_start(self):
@@ -110,9 +257,7 @@ class Record:
         returned, yielding a 0-length interval together with
         :py:meth:`~Record.affected_end`
         """
-        types = {alt.type for alt in self.ALT}  # set!
-        BAD_MIX = {INS, SV, BND, SYMBOLIC}  # don't mix well with others
-        if (BAD_MIX & types) and len(types) == 1 and list(types)[0] == INS:
+        if self._is_insertion_only():
             # Only insertions, return 0-based position right of first base
             return self.POS  # right of first base
         else:  # Return 0-based start position of first REF base
@@ -127,22 +272,46 @@ class Record:
         position behind the insert position is returned, yielding a 0-length
         interval together with :py:meth:`~Record.affected_start`
         """
-        types = {alt.type for alt in self.ALT}  # set!
-        BAD_MIX = {INS, SV, BND, SYMBOLIC}  # don't mix well with others
-        if (BAD_MIX & types) and len(types) == 1 and list(types)[0] == INS:
+        if self._is_insertion_only():
             # Only insertions, return 0-based position right of first base
             return self.POS  # right of first base
         else:  # Return 0-based end position, behind last REF base
             return (self.POS - 1) + len(self.REF)
 
+    def _is_insertion_only(self):
+        """Return whether there are ALT alleles and all are insertions
+
+        INS does not mix well with the other types for computing the
+        affected interval, so the interval only starts right of the first
+        base if there are no other types.
+        """
+        alts = self.ALT
+        # check the first allele before setting up the generator
+        return bool(alts) and alts[0].type == INS and all(alt.type == INS for alt in alts)
+
     def add_filter(self, label):
         """Add label to FILTER if not set yet, removing ``PASS`` entry if
         present
+
+        ``FILTER`` is replaced by a new list if it changes, the previous
+        value is never modified.
         """
-        if label not in self.FILTER:
-            if "PASS" in self.FILTER:
-                self.FILTER = [f for f in self.FILTER if f != "PASS"]
-            self.FILTER.append(label)
+        filters = []
+        has_label = False
+        changed = False
+        for f in self.FILTER:
+            if f == label:
+                has_label = True
+                filters.append(f)
+            elif f == "PASS":
+                changed = True
+            else:
+                filters.append(f)
+        if not has_label:
+            filters.append(label)
+            changed = True
+        if changed:
+            self.FILTER = filters
 
     def add_format(self, key, value=None):
         """Add an entry to format
@@ -162,9 +331,27 @@ class Record:
         """Return generator yielding from ``self.calls``"""
         yield from self.calls
 
+    def _fields(self):
+        """Return tuple with the values compared by ``__eq__``"""
+        return (
+            self.CHROM,
+            self.POS,
+            self.begin,
+            self.end,
+            self.ID,
+            self.REF,
+            self.ALT,
+            self.QUAL,
+            self.FILTER,
+            self.INFO,
+            self.FORMAT,
+            self.calls,
+            self.call_for_sample,
+        )
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self._fields() == other._fields()
         return NotImplemented
 
     def __ne__(self, other):
@@ -172,12 +359,11 @@ class Record:
             return not self.__eq__(other)
         return NotImplemented
 
-    def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+    __hash__ = None
 
     def __str__(self):
-        tpl = "Record({})"
-        lst = [
+        tpl = "Record({!r}, {!r}, {!r}, {!r}, {!r}, {!r}, {!r}, {!r}, {!r}, {!r})"
+        return tpl.format(
             self.CHROM,
             self.POS,
             self.ID,
@@ -188,8 +374,7 @@ class Record:
             self.INFO,
             self.FORMAT,
             self.calls,
-        ]
-        return tpl.format(", ".join(map(repr, lst)))
+        )
 
     def __repr__(self):
         return str(self)
@@ -198,6 +383,8 @@ class Record:
 class UnparsedCall:
     """Placeholder for :py:class:`Call` when parsing only a subset of fields"""
 
+    __slots__ = ("sample", "unparsed_data", "site")
+
     def __init__(self, sample, unparsed_data, site=None):
         #: the name of the sample for which the call was made
         self.sample = sample
@@ -207,6 +394,9 @@ class UnparsedCall:
         self.site = site
 
 
+#: Filters ignored by :py:meth:`Call.is_filtered` by default
+DEFAULT_IGNORED_FILTERS = frozenset(("PASS",))
+
 #: Regular expression for splitting alleles
 ALLELE_DELIM = re.compile(r"[|/]")
 
@@ -219,6 +409,17 @@ class Call:
     coverage at the variant position.
     """
 
+    __slots__ = (
+        "sample",
+        "data",
+        "site",
+        "_gt_alleles",
+        "_called",
+        "_ploidy",
+        "_is_phased",
+        "_gt_parsed",
+    )
+
     def __init__(self, sample, data, site=None):
         #: the name of the sample for which the call was made
         self.sample = sample
@@ -227,13 +428,8 @@ class Call:
         self.data = data
         #: the :py:class:`Record` of this :py:class:`Call`
         self.site = site
-        #: the allele numbers (0, 1, ...) in this calls or None for no-call
-        self.gt_alleles = None
-        #: whether or not the variant is fully called
-        self.called = None
-        #: the number of alleles in this sample's call
-        self.ploidy = None
-        self._genotype_updated()
+        # the fields derived from ``data["GT"]`` are computed on first access
+        self._gt_parsed = False
 
     def set_genotype(self, genotype):
         """Set ``self.data["GT"]`` to ``genotype`` and properly update related
@@ -244,44 +440,87 @@ class Call:
 
     def _genotype_updated(self):
         """Update fields related to ``self.data["GT"]``."""
-        if self.data.get("GT", None) is None:
-            self.gt_alleles = None
-            self.called = None
-            self.ploidy = None
+        self._gt_parsed = True
+        gt = self.data.get("GT", None)
+        if gt is None:
+            self._gt_alleles = None
+            self._called = None
+            self._ploidy = None
+            self._is_phased = False
         else:
-            self.gt_alleles = []
-            for allele in ALLELE_DELIM.split(str(self.data["GT"])):
-                if allele == ".":
-                    self.gt_alleles.append(None)
-                else:
-                    self.gt_alleles.append(int(allele))
-            self.called = all([al is not None for al in self.gt_alleles])
-            self.ploidy = len(self.gt_alleles)
+            gt = str(gt)
+            # split in C instead of using ALLELE_DELIM, unifying the delimiters
+            # only for phased calls that may mix them
+            if "|" in gt:
+                self._is_phased = True
+                alleles = gt.replace("/", "|").split("|")
+            else:
+                self._is_phased = False
+                alleles = gt.split("/")
+            self._gt_alleles = [None if allele == "." else int(allele) for allele in alleles]
+            self._called = None not in self._gt_alleles
+            self._ploidy = len(self._gt_alleles)
+
+    @property
+    def gt_alleles(self):
+        """The allele numbers (0, 1, ...) in this call or ``None`` for no-call"""
+        if not self._gt_parsed:
+            self._genotype_updated()
+        return self._gt_alleles
+
+    @gt_alleles.setter
+    def gt_alleles(self, gt_alleles):
+        if not self._gt_parsed:
+            self._genotype_updated()
+        self._gt_alleles = gt_alleles
+
+    @property
+    def called(self):
+        """Whether or not the variant is fully called"""
+        if not self._gt_parsed:
+            self._genotype_updated()
+        return self._called
+
+    @called.setter
+    def called(self, called):
+        if not self._gt_parsed:
+            self._genotype_updated()
+        self._called = called
+
+    @property
+    def ploidy(self):
+        """The number of alleles in this sample's call"""
+        if not self._gt_parsed:
+            self._genotype_updated()
+        return self._ploidy
+
+    @ploidy.setter
+    def ploidy(self, ploidy):
+        if not self._gt_parsed:
+            self._genotype_updated()
+        self._ploidy = ploidy
 
     @property
     def is_phased(self):
         """Return boolean indicating whether this call is phased"""
-        return "|" in self.data.get("GT", "")
+        if not self._gt_parsed:
+            self._genotype_updated()
+        return self._is_phased
 
     @property
     def gt_phase_char(self):
         """Return character to use for phasing"""
-        return "/" if not self.is_phased else "|"
+        return "|" if self.is_phased else "/"
 
     @property
     def gt_bases(self):
         """Return the actual genotype bases, e.g. if VCF genotype is 0/1,
         could return ('A', 'T')
         """
-        result = []
-        for a in self.gt_alleles:
-            if a is None:
-                result.append(None)
-            elif a == 0:
-                result.append(self.site.REF)
-            else:
-                result.append(self.site.ALT[a - 1].value)
-        return tuple(result)
+        ref, alt = self.site.REF, self.site.ALT
+        return tuple(
+            [None if a is None else (ref if a == 0 else alt[a - 1].value) for a in self.gt_alleles]
+        )
 
     @property
     def gt_type(self):
@@ -290,12 +529,14 @@ class Call:
         """
         if not self.called:
             return None  # not called
-        elif all(a == 0 for a in self.gt_alleles):
+        alleles = self.gt_alleles
+        first = alleles[0]
+        if alleles.count(first) != len(alleles):
+            return HET
+        elif first == 0:
             return HOM_REF
-        elif len(set(self.gt_alleles)) == 1:
-            return HOM_ALT
         else:
-            return HET
+            return HOM_ALT
 
     def is_filtered(self, require=None, ignore=None):
         """Return ``True`` for filtered calls
@@ -305,17 +546,16 @@ class Call:
         :param iterable require: if set, the filters to require for returning
             ``True``
         """
-        ignore = ignore or ["PASS"]
-        if "FT" not in self.data or not self.data["FT"]:
+        fts = self.data.get("FT")
+        if not fts:
             return False
-        for ft in self.data["FT"]:
-            if ft in ignore:
-                continue  # skip
-            if not require:
-                return True
-            elif ft in require:
-                return True
-        return False
+        elif not ignore and not require and len(fts) == 1:
+            return fts[0] != "PASS"  # common case of a single filter
+        ignore = ignore or DEFAULT_IGNORED_FILTERS
+        if require:
+            return any(ft not in ignore and ft in require for ft in fts)
+        else:
+            return any(ft not in ignore for ft in fts)
 
     @property
     def is_het(self):
@@ -327,9 +567,21 @@ class Call:
         """Return ``True`` for non-hom-ref calls"""
         return bool(self.gt_type)
 
+    def _fields(self):
+        """Return tuple with the values compared by ``__eq__``"""
+        return (
+            self.sample,
+            self.data,
+            self.site,
+            self.gt_alleles,
+            self.called,
+            self.ploidy,
+            self.is_phased,
+        )
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self._fields() == other._fields()
         return NotImplemented
 
     def __ne__(self, other):
@@ -337,13 +589,10 @@ class Call:
             return not self.__eq__(other)
         return NotImplemented
 
-    def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+    __hash__ = None
 
     def __str__(self):
-        tpl = "Call({})"
-        lst = [self.sample, self.data]
-        return tpl.format(", ".join(map(repr, lst)))
+        return "Call({!r}, {!r})".format(self.sample, self.data)
 
     def __repr__(self):
         return str(self)
@@ -355,15 +604,23 @@ class AltRecord:
     Currently, can be a substitution, an SV placeholder, or breakend
     """
 
+    __slots__ = ("type",)
+
     def __init__(self, type_=None):
+        # the type is interned, so comparisons with the type constants
+        # (interned as literals) succeed on the identity check of str.__eq__
         #: String describing the type of the variant, could be one of
         #: SNV, MNV, could be any of teh types described in the ALT
         #: header lines, such as DUP, DEL, INS, ...
-        self.type = type_
+        self.type = type_ if type_ is None else sys.intern(type_)
+
+    def _fields(self):
+        """Return tuple with the values compared by ``__eq__`` and hashed"""
+        return (self.type,)
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self._fields() == other._fields()
         return NotImplemented
 
     def __ne__(self, other):
@@ -372,7 +629,7 @@ class AltRecord:
         return NotImplemented
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+        return hash(self._fields())
 
     def serialize(self):
         """Return ``str`` with representation for VCF file"""
@@ -386,6 +643,8 @@ class Substitution(AltRecord):
     Note that this subsumes MNVs, insertions, and deletions.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, type_, value):
         super().__init__(type_)
         #: The alternative base sequence to use in the substitution
@@ -394,9 +653,12 @@ class Substitution(AltRecord):
     def serialize(self):
         return self.value
 
+    def _fields(self):
+        return (self.type, self.value)
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self._fields() == other._fields()
         return NotImplemented
 
     def __ne__(self, other):
@@ -405,11 +667,10 @@ class Substitution(AltRecord):
         return NotImplemented
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+        return hash(self._fields())
 
     def __str__(self):
-        tpl = "Substitution(type_={}, value={})"
-        return tpl.format(*map(repr, [self.type, self.value]))
+        return "Substitution(type_={!r}, value={!r})".format(self.type, self.value)
 
     def __repr__(self):
         return str(self)
@@ -425,14 +686,26 @@ FORWARD = "+"
 #: code for reverse orientation
 REVERSE = "-"
 
+#: Templates for the remote part of :py:class:`BreakEnd` by mate orientation
+BREAKEND_REMOTE_TEMPLATES = {FORWARD: "[{}:{}[", REVERSE: "]{}:{}]"}
+
 
 class BreakEnd(AltRecord):
     """A placeholder for a breakend"""
 
+    __slots__ = (
+        "mate_chrom",
+        "mate_pos",
+        "orientation",
+        "mate_orientation",
+        "sequence",
+        "within_main_assembly",
+    )
+
     def __init__(
         self, mate_chrom, mate_pos, orientation, mate_orientation, sequence, within_main_assembly
     ):
-        super().__init__("BND")
+        super().__init__(BND)
         #: chromosome of the mate breakend
         self.mate_chrom = mate_chrom
         #: position of the mate breakend
@@ -456,16 +729,27 @@ class BreakEnd(AltRecord):
                 mate_chrom = self.mate_chrom
             else:
                 mate_chrom = "<{}>".format(self.mate_chrom)
-            tpl = {FORWARD: "[{}:{}[", REVERSE: "]{}:{}]"}[self.mate_orientation]
+            tpl = BREAKEND_REMOTE_TEMPLATES[self.mate_orientation]
             remote_tag = tpl.format(mate_chrom, self.mate_pos)
         if self.orientation == FORWARD:
             return remote_tag + self.sequence
         else:
             return self.sequence + remote_tag
 
+    def _fields(self):
+        return (
+            self.type,
+            self.mate_chrom,
+            self.mate_pos,
+            self.orientation,
+            self.mate_orientation,
+            self.sequence,
+            self.within_main_assembly,
+        )
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self._fields() == other._fields()
         return NotImplemented
 
     def __ne__(self, other):
@@ -474,19 +758,18 @@ class BreakEnd(AltRecord):
         return NotImplemented
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+        return hash(self._fields())
 
     def __str__(self):
-        tpl = "BreakEnd({})"
-        vals = [
+        tpl = "BreakEnd({!r}, {!r}, {!r}, {!r}, {!r}, {!r})"
+        return tpl.format(
             self.mate_chrom,
             self.mate_pos,
             self.orientation,
             self.mate_orientation,
             self.sequence,
             self.within_main_assembly,
-        ]
-        return tpl.format(", ".join(map(repr, vals)))
+        )
 
     def __repr__(self):
         return str(self)
@@ -495,12 +778,14 @@ class BreakEnd(AltRecord):
 class SingleBreakEnd(BreakEnd):
     """A placeholder for a single breakend"""
 
+    __slots__ = ()
+
     def __init__(self, orientation, sequence):
         super().__init__(None, None, orientation, None, sequence, None)
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self._fields() == other._fields()
         return NotImplemented
 
     def __ne__(self, other):
@@ -509,12 +794,10 @@ class SingleBreakEnd(BreakEnd):
         return NotImplemented
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+        return super().__hash__()
 
     def __str__(self):
-        tpl = "SingleBreakEnd({})"
-        vals = [self.orientation, self.sequence]
-        return tpl.format(", ".join(map(repr, vals)))
+        return "SingleBreakEnd({!r}, {!r})".format(self.orientation, self.sequence)
 
 
 class SymbolicAllele(AltRecord):
@@ -525,6 +808,8 @@ class SymbolicAllele(AltRecord):
     structural variants or IUPAC parameters.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value):
         super().__init__(SYMBOLIC)
         #: The symbolic value, e.g. 'DUP'
@@ -533,9 +818,12 @@ class SymbolicAllele(AltRecord):
     def serialize(self):
         return "<{}>".format(self.value)
 
+    def _fields(self):
+        return (self.type, self.value)
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self._fields() == other._fields()
         return NotImplemented
 
     def __ne__(self, other):
@@ -544,10 +832,10 @@ class SymbolicAllele(AltRecord):
         return NotImplemented
 
     def __hash__(self):
-        return hash(tuple(sorted(self.__dict__.items())))
+        return hash(self._fields())
 
     def __str__(self):
-        return "SymbolicAllele({})".format(repr(self.value))
+        return "SymbolicAllele({!r})".format(self.value)
 
     def __repr__(self):
         return str(self)
@@ -4,6 +4,8 @@
 Currently, only writing to plain-text files is supported
 """
 
+import functools
+
 from . import parser
 from . import record
 from . import bgzf
@@ -19,9 +21,8 @@ def format_atomic(value, section):
     """
     # Perform escaping
     if isinstance(value, str):
-        if any(r in value for r in record.RESERVED_CHARS[section]):
-            for k, v in record.ESCAPE_MAPPING:
-                value = value.replace(k, v)
+        if record.RESERVED_PATTERNS[section].search(value):
+            value = record.escape_value(value)
     # String-format the given value
     if value is None:
         return "."
@@ -48,6 +49,33 @@ def format_value(field_info, value, section):
             return ",".join(map(lambda x: format_atomic(x, section), value))
 
 
+def make_field_value_formatter(field_info, section):
+    """Return function for formatting a value according to ``field_info``
+
+    The returned function behaves like :py:func:`format_value` with
+    ``field_info`` and ``section`` bound but only dispatches on the field's
+    ID and number once.
+    """
+    if section == "FORMAT" and field_info.id == "FT":
+        return functools.partial(format_value, field_info, section=section)
+    elif field_info.number == 1:
+
+        def format_one(value):
+            if value is None:
+                return "."
+            return format_atomic(value, section)
+
+        return format_one
+    else:
+
+        def format_list(value):
+            if not value:
+                return "."
+            return ",".join([format_atomic(x, section) for x in value])
+
+        return format_list
+
+
 class Writer:
     """Class for writing VCF files to ``file``-like objects
 
@@ -105,6 +133,22 @@ class Writer:
         self.header = header.copy()
         #: optional ``str`` with the path to the stream
         self.path = path
+        # Value formatters for the INFO/FORMAT fields defined in the header,
+        # together with the serialized "KEY=" prefix for INFO, and the INFO
+        # flags, other fields are looked up for each value
+        infos = {key: self.header.get_info_field_info(key) for key in self.header.info_ids()}
+        self._info_flags = {key for key, info in infos.items() if info.type == "Flag"}
+        self._info_formatters = {
+            key: (key + "=", make_field_value_formatter(info, "INFO"))
+            for key, info in infos.items()
+            if info.type != "Flag"
+        }
+        self._format_formatters = {
+            key: make_field_value_formatter(self.header.get_format_field_info(key), "FORMAT")
+            for key in self.header.format_ids()
+        }
+        # Cache of the keys and their value formatters by FORMAT string
+        self._format_cache = {}
         # write out headers
         self._write_header()
 
@@ -132,44 +176,79 @@ class Writer:
     def _serialize_record(self, record):
         """Serialize whole Record"""
         f = self._empty_to_dot
-        row = [record.CHROM, record.POS]
-        row.append(f(";".join(record.ID)))
-        row.append(f(record.REF))
         if not record.ALT:
-            row.append(".")
+            alt = "."
         else:
-            row.append(",".join([f(a.serialize()) for a in record.ALT]))
-        row.append(f(record.QUAL))
-        row.append(f(";".join(record.FILTER)))
-        row.append(f(self._serialize_info(record)))
-        if record.FORMAT:
-            row.append(":".join(record.FORMAT))
-        row += [
-            self._serialize_call(record.FORMAT, record.call_for_sample[s])
-            for s in self.header.samples.names
+            alt = ",".join([f(a.serialize()) for a in record.ALT])
+        row = [
+            str(record.CHROM),
+            str(record.POS),
+            ";".join(record.ID) or ".",
+            f(record.REF),
+            alt,
+            str(f(record.QUAL)),
+            ";".join(record.FILTER) or ".",
+            self._serialize_info(record) or ".",
         ]
-        print(*row, sep="\t", file=self.stream)
+        if record.FORMAT:
+            format_str = ":".join(record.FORMAT)
+            row.append(format_str)
+            formatters = self._get_format_formatters(format_str, record.FORMAT)
+        else:
+            formatters = ()
+        serialize_call = self._serialize_call
+        call_for_sample = record.call_for_sample
+        for name in self.header.samples.names:
+            row.append(serialize_call(formatters, call_for_sample[name]))
+        # build the line in one go instead of letting print() convert and write each column
+        self.stream.write("\t".join(row) + "\n")
 
     def _serialize_info(self, record):
         """Return serialized version of record.INFO"""
         result = []
+        formatters = self._info_formatters
         for key, value in record.INFO.items():
-            info = self.header.get_info_field_info(key)
-            if info.type == "Flag":
+            prefix_formatter = formatters.get(key)
+            if prefix_formatter is not None:
+                prefix, formatter = prefix_formatter
+                result.append(prefix + formatter(value))
+            elif key in self._info_flags:
                 result.append(key)
             else:
-                result.append("{}={}".format(key, format_value(info, value, "INFO")))
+                info = self.header.get_info_field_info(key)
+                if info.type == "Flag":
+                    result.append(key)
+                else:
+                    result.append("{}={}".format(key, format_value(info, value, "INFO")))
         return ";".join(result)
 
-    def _serialize_call(self, format_, call):
-        """Return serialized version of the Call using the record's FORMAT'"""
+    def _get_format_formatters(self, format_str, format_):
+        """Return tuple of pairs of the keys in ``format_`` and their value
+        formatters, cached by the FORMAT string ``format_str``
+        """
+        result = self._format_cache.get(format_str)
+        if result is None:
+            result = self._format_cache[format_str] = tuple(
+                (
+                    key,
+                    self._format_formatters.get(key)
+                    or make_field_value_formatter(self.header.get_format_field_info(key), "FORMAT"),
+                )
+                for key in format_
+            )
+        return result
+
+    def _serialize_call(self, formatters, call):
+        """Return serialized version of the Call using the keys and value
+        formatters for the record's FORMAT
+        """
         if isinstance(call, record.UnparsedCall):
             return call.unparsed_data
         else:
-            result = [
-                format_value(self.header.get_format_field_info(key), call.data.get(key), "FORMAT")
-                for key in format_
-            ]
+            data = call.data
+            result = []
+            for key, formatter in formatters:
+                result.append(formatter(data.get(key)))
             return ":".join(result)
 
     @classmethod